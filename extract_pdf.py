@@ -1,23 +1,187 @@
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import PyPDF2
+from PyPDF2.generic import (ArrayObject, DictionaryObject, IndirectObject,
+                            StreamObject)
+
+# Bump the leading number when the cache layout or page hash changes; the
+# PyPDF2 version is included because upgrades can change extracted text
+CACHE_VERSION = f'2:{PyPDF2.__version__}'
+
+# Set once per worker process by _init_worker
+_worker_reader = None
+_worker_cached = frozenset()
+
+
+def _init_worker(pdf_path, cached_hashes):
+    global _worker_reader, _worker_cached
+    _worker_reader = PyPDF2.PdfReader(pdf_path)
+    _worker_cached = frozenset(cached_hashes)
+
+
+def _process_page(page_num):
+    """Hash a page and extract its text unless the hash is already cached.
+
+    Returns (page_num, hash, text) where text is None for cache hits.
+    """
+    page = _worker_reader.pages[page_num]
+    digest = page_hash(page)
+    if digest in _worker_cached:
+        return page_num, digest, None
+    return page_num, digest, page.extract_text()
+
+
+def _feed(hasher, obj, seen):
+    """Feed a PDF object into hasher, resolving indirect references.
+
+    Streams contribute their decoded data, except images, which cannot
+    change the extracted text and would be expensive to decode.
+    """
+    if isinstance(obj, IndirectObject):
+        # Object numbers change when a PDF is regenerated, so hash repeat
+        # references by first-visit order rather than by number
+        key = (obj.idnum, obj.generation)
+        if key in seen:
+            hasher.update(f'R{seen[key]};'.encode())
+            return
+        seen[key] = len(seen)
+        obj = obj.get_object()
+    if isinstance(obj, DictionaryObject):
+        hasher.update(b'<<')
+        for name in sorted(obj):
+            if name == '/Parent':
+                continue
+            hasher.update(name.encode('utf-8', 'surrogateescape'))
+            _feed(hasher, obj.raw_get(name), seen)
+        hasher.update(b'>>')
+        if isinstance(obj, StreamObject) and obj.get('/Subtype') != '/Image':
+            hasher.update(obj.get_data())
+    elif isinstance(obj, ArrayObject):
+        hasher.update(b'[')
+        for item in obj:
+            _feed(hasher, item, seen)
+        hasher.update(b']')
+    else:
+        hasher.update(repr(obj).encode('utf-8', 'surrogateescape') + b';')
+
+
+def page_hash(page):
+    """Hash everything extract_text() depends on for a page.
+
+    That is the content stream(s) plus the resolved /Resources: fonts with
+    their encodings and /ToUnicode CMaps, and Form XObjects. /Contents may
+    be a single stream or an array of streams (as in "FYP Documentation..pdf");
+    _feed resolves and hashes each element of an array in order.
+    """
+    hasher = hashlib.sha256()
+    seen = {}
+    _feed(hasher, page.raw_get('/Contents') if '/Contents' in page else None, seen)
+    _feed(hasher, page.raw_get('/Resources') if '/Resources' in page else None, seen)
+    return hasher.hexdigest()
+
+
+def load_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('pages', {})
+
+
+def save_cache(cache_path, pages):
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+        json.dump({'version': CACHE_VERSION, 'pages': pages}, cache_file)
+    os.replace(tmp_path, cache_path)
+
+
+def write_page(text_file, page_num, text):
+    text_file.write(f"\n--- Page {page_num + 1} ---\n\n")
+    text_file.write(text)
+    text_file.write("\n")
+
+
+def extract_pdf(pdf_path, output_path, cache_path=None, workers=None):
+    """Extract the text of every page in pdf_path into output_path.
+
+    Pages are hashed and extracted in parallel, and each page is written
+    straight to output_path as soon as it and every page before it are
+    ready, so the file can be followed while a long run is in progress.
+    The write is not atomic: if a page fails, output_path keeps the pages
+    written before it. Text is cached by page hash so unchanged pages are
+    not re-extracted on later runs; pages finished before a failure are
+    still cached. Returns a (total_pages, extracted_pages) tuple.
+    """
+    if cache_path is None:
+        cache_path = output_path + '.cache.json'
+
+    num_pages = len(PyPDF2.PdfReader(pdf_path).pages)
+    cache = load_cache(cache_path)
+    hashes = {}
+    texts = {}
+    extracted = 0
+    error = None
+
+    next_page = 0
+    with open(output_path, 'w', encoding='utf-8') as text_file:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(pdf_path, list(cache))) as executor:
+            futures = [executor.submit(_process_page, n) for n in range(num_pages)]
+            # Keep collecting after a failure so every finished page is cached
+            for future in as_completed(futures):
+                try:
+                    page_num, digest, text = future.result()
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+                    continue
+                if text is None:
+                    text = cache[digest]
+                else:
+                    extracted += 1
+                hashes[page_num] = digest
+                texts[page_num] = text
+                while error is None and next_page in texts:
+                    write_page(text_file, next_page, texts[next_page])
+                    next_page += 1
+
+    if error is not None:
+        cache.update({hashes[n]: texts[n] for n in texts})
+        save_cache(cache_path, cache)
+        raise error
+
+    # Only keep entries for the current document so the cache does not grow
+    save_cache(cache_path, {hashes[n]: texts[n] for n in range(num_pages)})
+    return num_pages, extracted
 
-# Open the PDF file
-pdf_file = open('FYP 2025.pdf', 'rb')
-pdf_reader = PyPDF2.PdfReader(pdf_file)
 
-# Get the number of pages
-num_pages = len(pdf_reader.pages)
-print(f"Total number of pages: {num_pages}")
+def main():
+    parser = argparse.ArgumentParser(description="Extract text from a PDF file.")
+    parser.add_argument('input', nargs='?', default='FYP 2025.pdf',
+                        help="PDF file to read (default: %(default)s)")
+    parser.add_argument('output', nargs='?', default='pdf_content.txt',
+                        help="text file to write (default: %(default)s)")
+    parser.add_argument('--cache', default=None,
+                        help="page cache file (default: <output>.cache.json)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    args = parser.parse_args()
 
-# Extract text from each page and write to a text file
-with open('pdf_content.txt', 'w', encoding='utf-8') as text_file:
-    for page_num in range(num_pages):
-        page = pdf_reader.pages[page_num]
-        text = page.extract_text()
-        text_file.write(f"\n--- Page {page_num + 1} ---\n\n")
-        text_file.write(text)
-        text_file.write("\n")
+    num_pages, extracted = extract_pdf(args.input, args.output,
+                                       cache_path=args.cache,
+                                       workers=args.workers)
+    print(f"Total number of pages: {num_pages}")
+    print(f"Extracted {extracted} page(s), reused {num_pages - extracted} from cache")
+    print(f"Text extraction complete. Content saved to '{args.output}'")
 
-# Close the PDF file
-pdf_file.close()
 
-print("Text extraction complete. Content saved to 'pdf_content.txt'") 
\ No newline at end of file
+if __name__ == '__main__':
+    main()